@@ -1,19 +1,53 @@
+import numpy as np
 import pandas as pd
 
+# محاسبه طول و deadline؛ در صورت نصب بودن numba به کد native کامپایل می‌شود
+try:
+    import numba
+
+    @numba.njit(cache=True)
+    def compute_columns(cpu, start, end):
+        n = cpu.size
+        lengths = np.empty(n, dtype=np.int64)
+        deadlines = np.empty(n, dtype=end.dtype)
+        for i in range(n):
+            lengths[i] = int(cpu[i]) * 1000
+            deadlines[i] = end[i] - start[i]
+        return lengths, deadlines
+except ImportError:
+    def compute_columns(cpu, start, end):
+        return cpu.astype(np.int64) * 1000, end - start
+
 # مسیر فایل‌های ورودی/خروجی
 input_csv = 'batch_task.csv'
 output_txt = 'workflow.txt'
+chunk_size = 1_000_000
 
-df = pd.read_csv(input_csv, header=None)
+# فقط ستون‌های start (5)، end (6) و CPU (8) خوانده می‌شوند
+reader = pd.read_csv(input_csv, header=None, usecols=[5, 6, 8],
+                     dtype={5: 'float32', 6: 'float32', 8: 'float32'},
+                     chunksize=chunk_size)
 
+idx_start = 0
 with open(output_txt, 'w') as f:
-    for idx, row in df.iterrows():
-        task_id = idx
-        length = int(row[8]) * 1000  # ستون CPU → طول task
-        input_size = 10  # MB فرضی
-        output_size = 10  # MB فرضی
-        pes = 1
-        cost = 0.1
-        deadline = (row[6] - row[5])  # مدت اجرای واقعی (تخمینی)
-
-        f.write(f"TASK, {task_id}, {length}, {input_size}, {output_size}, {pes}, {cost}, {deadline}\n")
+    for chunk in reader:
+        n = len(chunk)
+
+        task_ids = np.arange(idx_start, idx_start + n, dtype=np.int64)
+        cpu = chunk[8].to_numpy()
+        # تبدیل NaN به int نامعتبر است؛ به جای نوشتن طول بی‌معنی خطا می‌دهیم
+        missing = np.isnan(cpu)
+        if missing.any():
+            raise ValueError(f"missing CPU value for task {idx_start + int(missing.argmax())}")
+        # ستون CPU → طول task، و end - start → مدت اجرای واقعی (تخمینی)
+        lengths, deadlines = compute_columns(cpu, chunk[5].to_numpy(), chunk[6].to_numpy())
+
+        # input/output = 10 MB فرضی، pes = 1، cost = 0.1
+        lines = np.char.add('TASK,', task_ids.astype(str))
+        lines = np.char.add(lines, ',')
+        lines = np.char.add(lines, lengths.astype(str))
+        lines = np.char.add(lines, ',10,10,1,0.1,')
+        lines = np.char.add(lines, deadlines.astype(str))
+
+        f.write('\n'.join(lines.tolist()) + '\n')
+        idx_start += n